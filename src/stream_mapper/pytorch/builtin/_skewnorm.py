@@ -4,16 +4,17 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ()
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import torch as xp
 
 from stream_mapper.core.builtin import WhereRequiredError
 from stream_mapper.core.builtin._stats.norm import logpdf as norm_logpdf
-from stream_mapper.core.builtin._stats.skewnorm import logpdf as skewnorm_logpdf
 
 from stream_mapper.pytorch._base import ModelBase
+from stream_mapper.pytorch.builtin._stats import _skewnorm_numba, _skewnorm_triton
+from stream_mapper.pytorch.builtin._stats.skewnorm import logpdf as skewnorm_logpdf
 
 if TYPE_CHECKING:
     from stream_mapper.core import Data, Params
@@ -32,9 +33,31 @@ class SkewNormal(ModelBase):
     points in the right direction, so here we can just approximate the
     log-probability with the log-probability of a normal distribution.
 
+    Parameters
+    ----------
+    likelihood_dtype : `torch.dtype` | None, optional keyword-only
+        The dtype in which to evaluate the log-pdf on CUDA, e.g.
+        ``torch.bfloat16`` to halve the memory traffic on recent GPUs. The
+        per-coordinate log-likelihoods are cast back to the dtype of the data
+        before they are summed. If `None` (default), the dtype of the data is
+        used.
+    use_triton : bool, optional keyword-only
+        Whether to evaluate the log-pdf on CUDA with a Triton kernel, if Triton
+        is installed, by default `False`. This is not used by subclasses that
+        override the log-pdf, e.g. the truncated skew-normal.
+
     """
 
     array_namespace: ArrayNamespace[Array] = xp
+    likelihood_dtype: xp.dtype | None = field(default=None, kw_only=True)
+    use_triton: bool = field(default=False, kw_only=True)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        # Pre-store the names used to index `where`.
+        self._where_names: tuple[str, ...]
+        object.__setattr__(self, "_where_names", tuple(self.coord_bounds.keys()))
 
     def ln_likelihood(
         self,
@@ -70,7 +93,7 @@ class SkewNormal(ModelBase):
         # 'where' is not provided, then all data points are assumed to be
         # available.
         if where is not None:
-            idx = where[tuple(self.coord_bounds.keys())].array
+            idx = where[self._where_names].array
         elif self.require_where:
             raise WhereRequiredError
         else:
@@ -91,24 +114,38 @@ class SkewNormal(ModelBase):
             skew = skew * sigma / self.xp.sqrt(sigma**2 + (1 + skew**2) * sigma_o**2)
             ln_s = self.xp.log(sigma**2 + sigma_o**2) / 2
 
+        xi = x[idx]
+        if self.likelihood_dtype is not None and x.is_cuda:
+            xi, mu, ln_s, skew = (
+                arr.to(self.likelihood_dtype) for arr in (xi, mu, ln_s, skew)
+            )
+
+        # The check of where the log-pdf is finite must use the same
+        # implementation as the log-pdf it guards. The Numba log-pdf is not
+        # differentiable, so it is only used if nothing needs gradients.
+        if _skewnorm_numba.can_use(xi, mu, ln_s, skew):
+            lpdf_fn = _skewnorm_numba.logpdf
+        elif self.use_triton and _skewnorm_triton.can_use(xi, mu, ln_s, skew):
+            lpdf_fn = _skewnorm_triton.logpdf
+        else:
+            lpdf_fn = skewnorm_logpdf
+
         # Find where -inf
         with xp.no_grad():
-            _lpdf = skewnorm_logpdf(
-                x[idx], loc=mu, ln_sigma=ln_s, skew=skew, xp=self.xp
-            )
+            _lpdf = lpdf_fn(xi, loc=mu, ln_sigma=ln_s, skew=skew, xp=self.xp)
             fnt = xp.isfinite(_lpdf)  # apply to X[idx] only
 
         # Compute SN where it's finite, to avoid numerical issues with the gradient
-        sn_lnpdf = self.xp.full_like(x[idx], 0)
-        sn_lnpdf[fnt] = skewnorm_logpdf(
-            x[idx][fnt], loc=mu[fnt], ln_sigma=ln_s[fnt], skew=skew[fnt], xp=self.xp
+        sn_lnpdf = self.xp.full_like(xi, 0)
+        sn_lnpdf[fnt] = lpdf_fn(
+            xi[fnt], loc=mu[fnt], ln_sigma=ln_s[fnt], skew=skew[fnt], xp=self.xp
         )
 
         # Compute normal where SN is infinite.
         # Subtract 100 b/c that's where the SN logpdf drops to -inf
-        n_lnpdf = norm_logpdf(x[idx], loc=mu, ln_sigma=ln_s, xp=self.xp) - 100
+        n_lnpdf = norm_logpdf(xi, loc=mu, ln_sigma=ln_s, xp=self.xp) - 100
 
-        idxlnliks = xp.where(fnt, sn_lnpdf, n_lnpdf)
+        idxlnliks = xp.where(fnt, sn_lnpdf, n_lnpdf).to(x.dtype)
 
         lnliks = self.xp.full_like(x, 0)  # missing data is ignored
         lnliks[idx] = idxlnliks
@@ -0,0 +1,3 @@
+"""Statistics functions, specialized for PyTorch."""
+
+__all__: tuple[str, ...] = ()
@@ -0,0 +1,95 @@
+"""Skew-Normal log-PDF, compiled with Numba for the CPU.
+
+For small arrays the per-op dispatch overhead of PyTorch dominates the
+floating-point work, so the whole expression is instead computed in a single
+compiled loop. This is only used if Numba is installed.
+
+The loop computes in float64, so its results differ from those of the PyTorch
+log-PDF. Callers must not mix the two within one likelihood evaluation, e.g. to
+find where the log-PDF is finite and then evaluate it there.
+"""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ()
+
+import math
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import torch as xp
+
+if TYPE_CHECKING:
+    from stream_mapper.core.typing import ArrayNamespace
+
+    from stream_mapper.pytorch.typing import Array
+
+try:
+    from numba import njit
+except ImportError:
+    HAS_NUMBA = False
+else:
+    HAS_NUMBA = True
+
+
+if HAS_NUMBA:
+    # fastmath without 'nnan' / 'ninf': -inf log-pdfs must be preserved, since
+    # they are used to find where the skew-normal is not numerically stable.
+    _FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+    @njit(fastmath=_FASTMATH, cache=True)  # type: ignore[misc]
+    def _logpdf_loop(
+        x: np.ndarray[Any, Any],
+        loc: np.ndarray[Any, Any],
+        ln_sigma: np.ndarray[Any, Any],
+        skew: np.ndarray[Any, Any],
+        out: np.ndarray[Any, Any],
+    ) -> None:
+        inv_sqrt2 = 1.0 / math.sqrt(2.0)
+        half_log2pi = 0.5 * math.log(2.0 * math.pi)
+        for i in range(x.size):
+            z = (x[i] - loc[i]) * math.exp(-ln_sigma[i])
+            out[i] = (
+                -0.5 * z * z
+                - ln_sigma[i]
+                - half_log2pi
+                + math.log(math.erfc(-skew[i] * z * inv_sqrt2))
+            )
+
+
+def can_use(x: Array, loc: Array, ln_sigma: Array, skew: Array) -> bool:
+    """Whether the Numba log-PDF can be used for these inputs.
+
+    The inputs must be on the CPU, of the same floating-point dtype, and not
+    require gradients, since the Numba loop is not differentiable.
+    """
+    arrays = (x, loc, ln_sigma, skew)
+    return (
+        HAS_NUMBA
+        and all(a.device.type == "cpu" for a in arrays)
+        and x.dtype in (xp.float32, xp.float64)
+        and all(a.dtype == x.dtype for a in arrays)
+        and not (xp.is_grad_enabled() and any(a.requires_grad for a in arrays))
+    )
+
+
+def logpdf(
+    x: Array,
+    /,
+    loc: Array,
+    ln_sigma: Array,
+    skew: Array,
+    *,
+    xp: ArrayNamespace[Array],
+) -> Array:
+    """Log-PDF of the skew-normal distribution.
+
+    This has the same signature as
+    :func:`stream_mapper.pytorch.builtin._stats.skewnorm.logpdf`. See
+    :func:`can_use` for the requirements on the inputs.
+    """
+    tensors = xp.broadcast_tensors(x, loc, ln_sigma, skew)
+    arrays = [t.detach().contiguous().numpy().ravel() for t in tensors]
+    out = np.empty_like(arrays[0])
+    _logpdf_loop(*arrays, out)
+    return xp.from_numpy(out).reshape(tensors[0].shape)
@@ -0,0 +1,169 @@
+"""Skew-Normal log-PDF, as a Triton kernel for CUDA.
+
+The log-PDF is memory-bound, so the whole expression is computed in one
+kernel that reads each input once and writes the output once. The gradient is
+computed with PyTorch ops. This is only used if Triton is installed and it
+is enabled with ``SkewNormal(use_triton=True)``.
+"""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ()
+
+import math
+from typing import TYPE_CHECKING, Any
+
+import torch as xp
+
+if TYPE_CHECKING:
+    from stream_mapper.core.typing import ArrayNamespace
+
+    from stream_mapper.pytorch.typing import Array
+
+try:
+    import triton
+    import triton.language as tl
+except ImportError:
+    HAS_TRITON = False
+else:
+    HAS_TRITON = True
+    try:
+        from triton.language.extra import libdevice
+    except ImportError:  # Triton < 3.0
+        libdevice = tl.math
+
+
+_half_log2pi = 0.5 * math.log(2 * math.pi)
+_inv_sqrt2 = 1 / math.sqrt(2)
+_inv_sqrtpi = 1 / math.sqrt(math.pi)
+
+
+if HAS_TRITON:
+    # Triton kernels can only read globals that are `constexpr`.
+    _tl_half_log2pi = tl.constexpr(_half_log2pi)
+    _tl_inv_sqrt2 = tl.constexpr(_inv_sqrt2)
+
+    # The inputs are boolean-indexed, so `n` changes on almost every call. The
+    # autotuning is keyed on the next power of 2 of `n`, so that it is only
+    # re-run for a new order of magnitude of the size.
+    @triton.autotune(  # type: ignore[misc]
+        configs=[triton.Config({"BLOCK": b}) for b in (256, 512, 1024, 2048)],
+        key=["n_bucket"],
+    )
+    @triton.jit  # type: ignore[misc]
+    def _logpdf_kernel(  # noqa: PLR0913, PLR0917
+        x_ptr: Any,
+        loc_ptr: Any,
+        ln_sigma_ptr: Any,
+        skew_ptr: Any,
+        out_ptr: Any,
+        n: Any,
+        n_bucket: Any,
+        BLOCK: tl.constexpr,  # noqa: N803
+    ) -> None:
+        i = tl.program_id(0) * BLOCK + tl.arange(0, BLOCK)
+        m = i < n
+        # Computed in float32, which libdevice requires.
+        x = tl.load(x_ptr + i, mask=m).to(tl.float32)
+        loc = tl.load(loc_ptr + i, mask=m).to(tl.float32)
+        ln_sigma = tl.load(ln_sigma_ptr + i, mask=m).to(tl.float32)
+        skew = tl.load(skew_ptr + i, mask=m).to(tl.float32)
+
+        z = (x - loc) * tl.exp(-ln_sigma)
+        out = (
+            -0.5 * z * z
+            - ln_sigma
+            - _tl_half_log2pi
+            + tl.log(libdevice.erfc(-skew * z * _tl_inv_sqrt2))
+        )
+        tl.store(out_ptr + i, out, mask=m)
+
+
+class _LogPDF(xp.autograd.Function):
+    """Skew-Normal log-PDF, with the forward pass in Triton."""
+
+    @staticmethod
+    def forward(  # type: ignore[override]
+        ctx: Any, x: Array, loc: Array, ln_sigma: Array, skew: Array
+    ) -> Array:
+        shapes = tuple(a.shape for a in (x, loc, ln_sigma, skew))
+        tensors = [t.contiguous() for t in xp.broadcast_tensors(x, loc, ln_sigma, skew)]
+        out = xp.empty_like(tensors[0])
+        n = out.numel()
+        if n > 0:  # a launch with an empty grid is an error
+            _logpdf_kernel[lambda meta: (triton.cdiv(n, meta["BLOCK"]),)](
+                *tensors, out, n, triton.next_power_of_2(n)
+            )
+
+        ctx.shapes = shapes
+        ctx.save_for_backward(*tensors)
+        return out
+
+    @staticmethod
+    def backward(  # type: ignore[override]
+        ctx: Any, grad: Array
+    ) -> tuple[Array, Array, Array, Array]:
+        grads = _logpdf_grads(grad, *ctx.saved_tensors)
+        return tuple(  # type: ignore[return-value]
+            gr.sum_to_size(shape) for gr, shape in zip(grads, ctx.shapes, strict=True)
+        )
+
+
+def _logpdf_grads(
+    grad: Array, x: Array, loc: Array, ln_sigma: Array, skew: Array
+) -> tuple[Array, Array, Array, Array]:
+    """Gradients of the log-PDF w.r.t. ``x``, ``loc``, ``ln_sigma``, ``skew``.
+
+    These are computed in float32, since `torch.special.erfcx` is not
+    implemented for half precision, and cast back to the dtype of the inputs.
+    """
+    dtype = x.dtype
+    grad, x, loc, ln_sigma, skew = (
+        a.to(xp.float32) for a in (grad, x, loc, ln_sigma, skew)
+    )
+    inv_sigma = xp.exp(-ln_sigma)
+    z = (x - loc) * inv_sigma
+    # d/dt log(erfc(-t)) = 2 / sqrt(pi) / erfcx(-t), which is stable in the tail
+    # where erfc(-t) underflows.
+    g = 2 * _inv_sqrtpi / xp.special.erfcx(-skew * z * _inv_sqrt2)
+    dz = grad * (g * skew * _inv_sqrt2 - z)
+
+    grads = (
+        dz * inv_sigma,  # x
+        -dz * inv_sigma,  # loc
+        -dz * z - grad,  # ln_sigma
+        grad * g * z * _inv_sqrt2,  # skew
+    )
+    return tuple(gr.to(dtype) for gr in grads)  # type: ignore[return-value]
+
+
+def can_use(x: Array, loc: Array, ln_sigma: Array, skew: Array) -> bool:
+    """Whether the Triton log-PDF can be used for these inputs.
+
+    The inputs must be on CUDA and of the same dtype, with at most single
+    precision since the kernel computes in float32.
+    """
+    arrays = (x, loc, ln_sigma, skew)
+    return (
+        HAS_TRITON
+        and all(a.is_cuda for a in arrays)
+        and x.dtype in (xp.float16, xp.bfloat16, xp.float32)
+        and all(a.dtype == x.dtype for a in arrays)
+    )
+
+
+def logpdf(
+    x: Array,
+    /,
+    loc: Array,
+    ln_sigma: Array,
+    skew: Array,
+    *,
+    xp: ArrayNamespace[Array],
+) -> Array:
+    """Log-PDF of the skew-normal distribution.
+
+    This has the signature of `skewnorm.logpdf`. See :func:`can_use` for the
+    requirements on the inputs.
+    """
+    return _LogPDF.apply(x, loc, ln_sigma, skew)  # type: ignore[no-any-return]
@@ -0,0 +1,71 @@
+"""Skew-Normal distribution."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ()
+
+import math
+from typing import TYPE_CHECKING
+
+import torch as xp
+
+if TYPE_CHECKING:
+    from stream_mapper.core.typing import ArrayNamespace
+
+    from stream_mapper.pytorch.typing import Array
+
+
+_half_log2pi = 0.5 * math.log(2 * math.pi)
+_sqrt2 = math.sqrt(2)
+
+
+def _logpdf(x: Array, loc: Array, ln_sigma: Array, skew: Array) -> Array:
+    # The normal log-pdf is inlined so the whole expression is one elementwise
+    # graph. 1 + erf(t) is written as erfc(-t), which does not cancel to 0 in
+    # the tail where erf(t) -> -1.
+    z = (x - loc) * xp.exp(-ln_sigma)
+    return -0.5 * z * z - ln_sigma - _half_log2pi + xp.log(xp.erfc(-skew * z / _sqrt2))
+
+
+# `torch.compile` (PyTorch >= 2.0) fuses the elementwise ops into one kernel.
+# Shapes are dynamic since the inputs are usually boolean-indexed.
+_logpdf_fused = (
+    xp.compile(_logpdf, fullgraph=True, dynamic=True)
+    if hasattr(xp, "compile")
+    else _logpdf
+)
+
+
+def logpdf(
+    x: Array,
+    /,
+    loc: Array,
+    ln_sigma: Array,
+    skew: Array,
+    *,
+    xp: ArrayNamespace[Array],
+) -> Array:
+    """Log-PDF of the skew-normal distribution.
+
+    Parameters
+    ----------
+    x : Array, positional-only
+        The value at which to evaluate the log-PDF.
+    loc : Array
+        The location.
+    ln_sigma : Array
+        The log of the scale.
+    skew : Array
+        The skewness.
+
+    xp : ArrayNamespace[Array], keyword-only
+        The array namespace.
+
+    Returns
+    -------
+    Array
+
+    """
+    if x.is_cuda:
+        return _logpdf_fused(x, loc, ln_sigma, skew)
+    return _logpdf(x, loc, ln_sigma, skew)
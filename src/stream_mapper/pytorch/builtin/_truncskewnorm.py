@@ -11,11 +11,11 @@ import torch as xp
 
 from stream_mapper.core.builtin import WhereRequiredError
 from stream_mapper.core.builtin._stats.trunc_norm import logpdf as truncnorm_logpdf
-from stream_mapper.core.builtin._stats.trunc_skewnorm import (
-    logpdf as truncskewnorm_logpdf,
-)
 
 from stream_mapper.pytorch.builtin import SkewNormal
+from stream_mapper.pytorch.builtin._stats.trunc_skewnorm import (
+    logpdf as truncskewnorm_logpdf,
+)
 
 if TYPE_CHECKING:
     from stream_mapper.core import Data, Params
@@ -27,6 +27,17 @@ if TYPE_CHECKING:
 class TruncatedSkewNormal(SkewNormal):
     """Truncated Skew-Normal."""
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        # Pre-store the truncation bounds, ordered by `coord_names`, as (F,)
+        # buffers so they follow the model between devices.
+        a, b = self.xp.asarray([self.coord_bounds[k] for k in self.coord_names]).T
+        self._ab_a: Array
+        self.register_buffer("_ab_a", a.contiguous(), persistent=False)
+        self._ab_b: Array
+        self.register_buffer("_ab_b", b.contiguous(), persistent=False)
+
     def ln_likelihood(
         self,
         mpars: Params[Array],
@@ -61,7 +72,7 @@ class TruncatedSkewNormal(SkewNormal):
         # 'where' is not provided, then all data points are assumed to be
         # available.
         if where is not None:
-            idx = where[tuple(self.coord_bounds.keys())].array
+            idx = where[self._where_names].array
         elif self.require_where:
             raise WhereRequiredError
         else:
@@ -70,9 +81,7 @@ class TruncatedSkewNormal(SkewNormal):
 
         cns, cens = self.coord_names, self.coord_err_names
         x = data[cns].array  # (N, F)
-        _0 = self.xp.zeros_like(x)[None, ...]  # (1, N, F)
-
-        a, b = _0 + self.xp.asarray([self.coord_bounds[k] for k in cns]).T[:, None, :]
+        a, b = self._ab_a.expand_as(x), self._ab_b.expand_as(x)  # (N, F)
         mu = self._stack_param(mpars, "mu", cns)[idx]
         ln_s = self._stack_param(mpars, "ln-sigma", cns)[idx]
         skew = self._stack_param(mpars, "skew", cns)[idx]
@@ -84,35 +93,37 @@ class TruncatedSkewNormal(SkewNormal):
             skew = skew * sigma / self.xp.sqrt(sigma**2 + (1 + skew**2) * sigma_o**2)
             ln_s = self.xp.log(sigma**2 + sigma_o**2) / 2
 
+        xi, ai, bi = x[idx], a[idx], b[idx]
+        if self.likelihood_dtype is not None and x.is_cuda:
+            xi, ai, bi, mu, ln_s, skew = (
+                arr.to(self.likelihood_dtype) for arr in (xi, ai, bi, mu, ln_s, skew)
+            )
+
         # Find where -inf
         with xp.no_grad():
             _lpdf = truncskewnorm_logpdf(
-                x[idx], loc=mu, ln_sigma=ln_s, skew=skew, a=a[idx], b=b[idx], xp=self.xp
+                xi, loc=mu, ln_sigma=ln_s, skew=skew, ab=(ai, bi), xp=self.xp
             )
             fnt = xp.isfinite(_lpdf)  # apply to X[idx] only
 
         # Compute SN where it's finite, to avoid numerical issues with the gradient
-        sn_lnpdf = self.xp.full_like(x[idx], 0)
+        sn_lnpdf = self.xp.full_like(xi, 0)
         sn_lnpdf[fnt] = truncskewnorm_logpdf(
-            x[idx][fnt],
+            xi[fnt],
             loc=mu[fnt],
             ln_sigma=ln_s[fnt],
             skew=skew[fnt],
-            a=a[idx][fnt],
-            b=b[idx][fnt],
+            ab=(ai[fnt], bi[fnt]),
             xp=self.xp,
         )
 
         # Compute normal where SN is infinite.
         # Subtract 100 b/c that's where the SN logpdf drops to -inf
         n_lnpdf = (
-            truncnorm_logpdf(
-                x[idx], loc=mu, ln_sigma=ln_s, a=a[idx], b=b[idx], xp=self.xp
-            )
-            - 100
+            truncnorm_logpdf(xi, loc=mu, ln_sigma=ln_s, a=ai, b=bi, xp=self.xp) - 100
         )
 
-        idxlnliks = xp.where(fnt, sn_lnpdf, n_lnpdf)
+        idxlnliks = xp.where(fnt, sn_lnpdf, n_lnpdf).to(x.dtype)
 
         lnliks = self.xp.full_like(x, 0)  # missing data is ignored
         lnliks[idx] = idxlnliks
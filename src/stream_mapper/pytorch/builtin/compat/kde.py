@@ -73,7 +73,7 @@ class KDEModel(ModelBase):
                 if not self.transpose
                 else data[self._all_coord_names].array.T
             )
-            return xp.log(xp.clip(xp.asarray(self.kernel(d)), 0))
+            return xp.log(xp.clamp_min(xp.asarray(self.kernel(d)), 0))
 
     def forward(self, data: Data[Array]) -> Array:
         """Forward pass.
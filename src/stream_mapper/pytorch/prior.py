@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import KW_ONLY, dataclass, field
+from dataclasses import KW_ONLY, dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+import torch as xp
 
 from stream_mapper.core import prior
 from stream_mapper.core.prior import *  # noqa: F403
@@ -12,6 +15,11 @@ from stream_mapper.core.typing import ArrayNamespace  # noqa: TC001
 
 from stream_mapper.pytorch.typing import Array
 
+if TYPE_CHECKING:
+    from stream_mapper.core import Data, ModelAPI, Params
+
+    from stream_mapper.pytorch.typing import NNModel
+
 __all__ = prior.__all__
 
 
@@ -21,7 +29,176 @@ class HardThreshold(CoreHardThreshold[Array]):  # type: ignore[no-redef]
     array_namespace: ArrayNamespace[Array] = field(default="torch", kw_only=True)  # type: ignore[arg-type]
 
 
+def _to_device(array: Array, /, device: xp.device) -> Array:
+    """Move the array to the device as a contiguous array."""
+    return array.to(device=device).contiguous()
+
+
 @dataclass(frozen=True, repr=False)
 class ControlRegions(CoreControlRegions[Array]):  # type: ignore[no-redef]
+    """Control regions prior.
+
+    Parameters
+    ----------
+    device : `torch.device` | str | None, optional keyword-only
+        The device on which to store the control points. If `None` (default),
+        the device of ``center``.
+    compile_model : bool, optional keyword-only
+        Whether to compile the model evaluated at the control points with
+        `torch.compile`, by default `False`. This needs a working compiler
+        toolchain and pays a one-time compilation cost.
+
+    """
+
     _: KW_ONLY
     array_namespace: ArrayNamespace[Array] = field(default="torch", kw_only=True)  # type: ignore[arg-type]
+    device: xp.device | str | None = field(default=None, kw_only=True)
+    compile_model: bool = field(default=False, kw_only=True)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        device = (
+            xp.device(self.device)
+            if self.device is not None
+            else self.center.array.device
+        )
+        object.__setattr__(
+            self, "_x", replace(self._x, array=_to_device(self._x.array, device))
+        )
+
+        # Normalize the control points and widths to a contiguous (C, F) layout,
+        # so the element-wise math in `logpdf` runs on unit-stride memory. A
+        # float width is kept as a scalar, rather than filling a (C, F) array.
+        dep_names = self._y_names
+        shape = (-1, len(dep_names))
+        y = _to_device(self.center[dep_names].array.reshape(shape), device)
+        w: Array | float
+        if isinstance(self.width, float):
+            w = self.width
+        else:
+            w = _to_device(self.width[dep_names].array.reshape(shape), device)
+
+        self._y: Array
+        object.__setattr__(self, "_y", y)
+        self._w: Array | float
+        object.__setattr__(self, "_w", w)
+
+        # Pre-compute the edges of the control regions.
+        self._lo: Array
+        object.__setattr__(self, "_lo", self._y - self._w)
+        self._hi: Array
+        object.__setattr__(self, "_hi", self._y + self._w)
+
+        # Pre-store the keys of the component parameters at the control points.
+        self._stack_keys: tuple[tuple[str, str], ...]
+        object.__setattr__(
+            self,
+            "_stack_keys",
+            tuple((n, self.component_param_name) for n in self._y_names),
+        )
+        # Whether there is a single dependent coordinate, e.g. phi2 vs phi1.
+        self._single: bool
+        object.__setattr__(self, "_single", len(self._y_names) == 1)
+        # Re-used output of the stack of the component parameters, (C, F). It
+        # is allocated on first use, with the dtype and device of the model's
+        # output, and only if there are several dependent coordinates.
+        self._cmp_buf: Array | None
+        object.__setattr__(self, "_cmp_buf", None)
+
+        # Pre-store the (negative) prior weight as a tensor.
+        self._neg_lamda: Array
+        object.__setattr__(
+            self, "_neg_lamda", xp.asarray(-self.lamda, dtype=y.dtype, device=device)
+        )
+
+        # If `compile_model`, the model is compiled on first use.
+        self._compiled_model: tuple[int | None, NNModel | None]
+        object.__setattr__(self, "_compiled_model", (None, None))
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get state, without the compiled model, which can't be pickled."""
+        state = getattr(super(), "__getstate__", lambda: self.__dict__)().copy()
+        state["_compiled_model"] = (None, None)
+        return state
+
+    def _compile(self, model: ModelAPI[Array, NNModel], /) -> NNModel:
+        """Compile the model, re-using the cached one if it is the same model.
+
+        `torch.compile` (PyTorch >= 2.0) removes the Python-side module dispatch
+        and fuses the element-wise layers of the network.
+        """
+        model_id, compiled = self._compiled_model
+        if model_id != id(model) or compiled is None:
+            compiled = xp.compile(model) if hasattr(xp, "compile") else model
+            object.__setattr__(self, "_compiled_model", (id(model), compiled))
+        return compiled
+
+    def _get_cmp_buf(self, col: Array, /) -> Array:
+        """Get the (C, F) stack buffer for columns like ``col``."""
+        buf = self._cmp_buf
+        shape = (len(col), len(self._stack_keys))
+        if (
+            buf is None
+            or buf.shape != shape
+            or buf.dtype != col.dtype
+            or buf.device != col.device
+        ):
+            buf = xp.empty(shape, dtype=col.dtype, device=col.device)
+            object.__setattr__(self, "_cmp_buf", buf)
+        return buf
+
+    def logpdf(
+        self,
+        mpars: Params[Array],
+        data: Data[Array],
+        model: ModelAPI[Array, NNModel],
+        current_lnpdf: Array | None = None,
+        /,
+    ) -> Array:
+        """Evaluate the logpdf.
+
+        This log-pdf is added to the current logpdf. So if you want to set the
+        logpdf to a specific value, you can uses the `current_lnpdf` to set the
+        output value such that ``current_lnpdf + logpdf = <want>``.
+
+        Parameters
+        ----------
+        mpars : Params[Array], position-only
+            Model parameters. Note that these are different from the ML
+            parameters.
+        data : Data[Array], position-only
+            The data for which evaluate the prior.
+        model : Model, position-only
+            The model for which evaluate the prior.
+        current_lnpdf : Array | None, optional position-only
+            The current logpdf, by default `None`. This is useful for setting
+            the additive log-pdf to a specific value.
+
+        Returns
+        -------
+        Array
+            The logpdf.
+
+        """
+        # Get model parameters evaluated at the control points. shape (C, 1).
+        pred = (self._compile(model) if self.compile_model else model)(self._x)
+        cmpars = model.unpack_params(pred)  # type: ignore[call-overload]
+        if self._single:  # (C, 1), without the copy of `stack`.
+            cmp_arr = cmpars[self._stack_keys[0]].unsqueeze(1)
+        else:  # (C, F)
+            cols = [cmpars[k] for k in self._stack_keys]
+            # `out=` is not differentiable, so the buffer is only re-used when
+            # gradients are not being tracked.
+            if xp.is_grad_enabled():
+                cmp_arr = xp.stack(cols, dim=1)
+            else:
+                cmp_arr = xp.stack(cols, dim=1, out=self._get_cmp_buf(cols[0]))
+
+        # For each control point, add the squared distance to the logpdf. The
+        # distance outside [y - w, y + w] is computed branchlessly, without
+        # boolean masks.
+        lower = xp.clamp_min(self._lo - cmp_arr, 0)
+        upper = xp.clamp_min(cmp_arr - self._hi, 0)
+        sq = xp.addcmul(upper.square(), lower, lower)  # lower^2 + upper^2
+        return self._neg_lamda * sq.sum()  # (C, F) -> (1,)
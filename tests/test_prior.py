@@ -0,0 +1,24 @@
+"""Test the priors."""
+
+import pickle
+
+import torch as xp
+
+from stream_mapper.pytorch import Data
+from stream_mapper.pytorch.prior import ControlRegions
+
+
+def test_control_regions_pickle() -> None:
+    """Pickling drops the compiled model, and round-trips everything else."""
+    center = Data(xp.asarray([[0.0, 1.0], [1.0, 2.0]]), names=("phi1", "phi2"))
+    prior = ControlRegions(center=center, width=0.5, lamda=0.05)
+    # A lambda can't be pickled, so this fails unless the cache is dropped.
+    object.__setattr__(prior, "_compiled_model", (0, lambda x: x))
+
+    loaded = pickle.loads(pickle.dumps(prior))  # noqa: S301
+
+    assert loaded._compiled_model == (None, None)
+    assert loaded.array_namespace is prior.array_namespace
+    assert xp.equal(loaded._lo, prior._lo)
+    assert xp.equal(loaded._hi, prior._hi)
+    assert loaded._stack_keys == prior._stack_keys
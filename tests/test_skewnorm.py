@@ -0,0 +1,63 @@
+"""Test the skew-normal log-PDF in reduced precision."""
+
+import pytest
+import torch as xp
+
+from stream_mapper.pytorch.builtin._stats import _skewnorm_triton, skewnorm
+
+
+def _inputs(dtype: xp.dtype, device: str = "cpu") -> tuple[xp.Tensor, ...]:
+    x = xp.linspace(-3, 3, 101, dtype=dtype, device=device)
+    loc = xp.full_like(x, 0.3)
+    ln_sigma = xp.full_like(x, 0.5)
+    skew = xp.full_like(x, -2.0)
+    return tuple(a.requires_grad_(True) for a in (x, loc, ln_sigma, skew))
+
+
+def _expected_grads(*arrays: xp.Tensor) -> tuple[xp.Tensor, ...]:
+    """Gradients of the float32 PyTorch log-PDF, by autograd."""
+    args = [a.detach().float().requires_grad_(True) for a in arrays]
+    skewnorm._logpdf(*args).sum().backward()
+    return tuple(a.grad for a in args)
+
+
+def test_triton_grads_bfloat16() -> None:
+    """The Triton backward supports bfloat16, e.g. for ``likelihood_dtype``."""
+    arrays = _inputs(xp.bfloat16)
+    grads = _skewnorm_triton._logpdf_grads(xp.ones_like(arrays[0]), *arrays)
+
+    for got, want in zip(grads, _expected_grads(*arrays), strict=True):
+        assert got.dtype == xp.bfloat16
+        assert xp.allclose(got.float(), want, rtol=2e-2, atol=2e-2)
+
+
+requires_triton = pytest.mark.skipif(
+    not (xp.cuda.is_available() and _skewnorm_triton.HAS_TRITON),
+    reason="requires CUDA and Triton",
+)
+
+
+@requires_triton
+@pytest.mark.parametrize(("dtype", "tol"), [(xp.float32, 1e-5), (xp.bfloat16, 2e-2)])
+@pytest.mark.parametrize("size", [101, 0])
+def test_triton_logpdf_cuda(dtype: xp.dtype, tol: float, size: int) -> None:
+    """The Triton log-PDF matches the PyTorch log-PDF, including empty inputs."""
+    arrays = [a[:size].detach() for a in _inputs(dtype, device="cuda")]
+    got = _skewnorm_triton.logpdf(*arrays, xp=xp)
+    want = skewnorm._logpdf(*(a.float() for a in arrays))
+
+    assert got.dtype == dtype
+    assert got.shape == want.shape
+    assert xp.allclose(got.float(), want, rtol=tol, atol=tol)
+
+
+@requires_triton
+def test_triton_logpdf_backward_bfloat16_cuda() -> None:
+    """``likelihood_dtype=torch.bfloat16`` log-PDFs can be trained on CUDA."""
+    arrays = _inputs(xp.bfloat16, device="cuda")
+    _skewnorm_triton.logpdf(*arrays, xp=xp).sum().backward()
+
+    for a, want in zip(arrays, _expected_grads(*arrays), strict=True):
+        assert a.grad is not None
+        assert a.grad.dtype == xp.bfloat16
+        assert xp.allclose(a.grad.float(), want, rtol=2e-2, atol=2e-2)